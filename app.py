@@ -1,15 +1,243 @@
 import os
+import json
+import uuid
+import tempfile
 import boto3
 import snowflake.connector
 import pandas as pd
-from io import StringIO
-from typing import Tuple
-from datetime import date
-from snowflake.connector.pandas_tools import write_pandas
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Iterator, Optional, Tuple, Union
+from datetime import date, timedelta
+from functools import lru_cache
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 load_dotenv()
 
+S3_MAX_WORKERS = 32
+# Objects larger than this are downloaded as parallel ranged GETs of this size
+S3_RANGE_SIZE = 16 * 1024 * 1024
+S3_MAX_RANGE_WORKERS = 8
+# Every object worker may be running a full set of ranged GETs at once
+S3_MAX_POOL_CONNECTIONS = S3_MAX_WORKERS * S3_MAX_RANGE_WORKERS
+
+# Concurrent upload threads used when PUTting load files to the user stage
+SNOWFLAKE_PUT_PARALLEL = 8
+
+# Reused across warm Lambda invocations, see get_s3_client and get_snowflake_conn
+_S3_CLIENT = None
+_SNOWFLAKE_CONN = None
+
+# Source listing fields used downstream, mapped to their warehouse column names
+LISTING_COLUMNS = {
+    "zipCode": "ZIP_CODE",
+    "price": "PRICE",
+    "bathrooms": "BATHROOMS",
+    "bedrooms": "BEDROOMS",
+    "squareFootage": "SQUARE_FOOTAGE",
+    "propertyType": "PROPERTY_TYPE",
+    "listedDate": "LISTED_DATE",
+    "removedDate": "REMOVED_DATE",
+    "lotSize": "LOT_SIZE",
+    "yearBuilt": "YEAR_BUILT",
+}
+# Listings missing any of these columns are dropped; only REMOVED_DATE is optional
+LISTING_NONNULL_COLUMNS = [column for column in LISTING_COLUMNS.values() if column != "REMOVED_DATE"]
+
+# Arrow types the LISTING_COLUMNS source fields are parsed into
+LISTING_SCHEMA = pa.schema(
+    [
+        ("zipCode", pa.string()),
+        ("price", pa.float64()),
+        ("bathrooms", pa.float64()),
+        ("bedrooms", pa.float64()),
+        ("squareFootage", pa.float64()),
+        ("propertyType", pa.string()),
+        ("listedDate", pa.string()),
+        ("removedDate", pa.string()),
+        ("lotSize", pa.float64()),
+        ("yearBuilt", pa.float64()),
+    ]
+)
+
+
+def get_s3_client() -> boto3.client:
+    """
+    Returns the module's S3 client, creating it on first use.
+
+    Returns:
+        boto3.client: S3 client.
+    """
+    global _S3_CLIENT
+    if _S3_CLIENT is None:
+        _S3_CLIENT = boto3.client(
+            "s3",
+            endpoint_url="https://s3.amazonaws.com",
+            aws_access_key_id=os.getenv("ACCESS_KEY"),
+            aws_secret_access_key=os.getenv("SECRET_ACCESS_KEY"),
+            config=Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS, retries={"mode": "adaptive"}),
+        )
+    return _S3_CLIENT
+
+
+def is_snowflake_conn_usable(conn: snowflake.connector.SnowflakeConnection) -> bool:
+    """
+    Checks that a connection can still run queries. is_closed() only reflects local
+    state, so a server session that expired while the Lambda container was frozen
+    is only detected by a round trip.
+
+    Args:
+        conn (snowflake.connector.SnowflakeConnection): Snowflake connection.
+
+    Returns:
+        bool: Whether a trivial query succeeds on the connection.
+    """
+    if conn.is_closed():
+        return False
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        return True
+    except snowflake.connector.errors.Error as e:
+        print(e)
+        return False
+
+
+def get_snowflake_conn() -> snowflake.connector.SnowflakeConnection:
+    """
+    Returns the module's Snowflake connection, reconnecting if it was never opened
+    or can no longer run queries.
+
+    Returns:
+        snowflake.connector.SnowflakeConnection: Snowflake connection.
+    """
+    global _SNOWFLAKE_CONN
+    if _SNOWFLAKE_CONN is None or not is_snowflake_conn_usable(_SNOWFLAKE_CONN):
+        if _SNOWFLAKE_CONN is not None:
+            try:
+                _SNOWFLAKE_CONN.close()
+            except snowflake.connector.errors.Error:
+                pass
+        _SNOWFLAKE_CONN = snowflake.connector.connect(
+            user=os.getenv("SNOWFLAKE_USERNAME"),
+            password=os.getenv("SNOWFLAKE_PASSWORD"),
+            account=os.getenv("SNOWFLAKE_ACCOUNT"),
+            warehouse=os.getenv("WAREHOUSE"),
+            database=os.getenv("DATABASE"),
+            schema=os.getenv("SCHEMA"),
+            client_session_keep_alive=True,
+            # Bind query parameters on the server so parameterized queries keep the same text
+            paramstyle="qmark",
+        )
+    return _SNOWFLAKE_CONN
+
+
+def get_s3_objects(client: boto3.client, bucket_name: str, prefix: str) -> Iterator[dict]:
+    """
+    Lazily yields the metadata of every object under a prefix, following pagination.
+
+    Args:
+        client (boto3.client): S3 client.
+        bucket_name (str): Name of the S3 bucket.
+        prefix (str): Key prefix to list.
+
+    Yields:
+        dict: Object metadata, including its "Key", "Size" and "ETag".
+    """
+    paginator = client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        yield from page.get("Contents", [])
+
+
+def get_s3_object_bytes(
+    client: boto3.client, bucket_name: str, key: str, size: int, etag: str
+) -> Union[bytes, bytearray]:
+    """
+    Downloads an object from S3, splitting it into parallel ranged GETs when it
+    is larger than S3_RANGE_SIZE. Ranged GETs are pinned to the listed ETag so
+    that ranges of different versions of the object are never mixed.
+
+    Args:
+        client (boto3.client): S3 client.
+        bucket_name (str): Name of the S3 bucket.
+        key (str): Key of the object to download.
+        size (int): Size of the object in bytes.
+        etag (str): ETag of the object, as listed.
+
+    Returns:
+        Union[bytes, bytearray]: Contents of the object.
+    """
+    if size <= S3_RANGE_SIZE:
+        return client.get_object(Bucket=bucket_name, Key=key)["Body"].read()
+
+    buffer = bytearray(size)
+
+    def fetch_range(start: int) -> None:
+        end = min(start + S3_RANGE_SIZE, size) - 1
+        obj = client.get_object(Bucket=bucket_name, Key=key, Range=f"bytes={start}-{end}", IfMatch=etag)
+        chunk = obj["Body"].read()
+        if len(chunk) != end - start + 1:
+            raise ValueError(f"{key}: expected {end - start + 1} bytes at offset {start}, got {len(chunk)}")
+        buffer[start : end + 1] = chunk
+
+    with ThreadPoolExecutor(max_workers=S3_MAX_RANGE_WORKERS) as executor:
+        list(executor.map(fetch_range, range(0, size, S3_RANGE_SIZE)))
+    return buffer
+
+
+def get_listing_table_from_records(records: list, key: str) -> pa.Table:
+    """
+    Builds an Arrow table with LISTING_SCHEMA from parsed listing records. Fields that
+    do not convert cleanly are coerced value by value, and values that still cannot be
+    converted become null and are reported.
+
+    Args:
+        records (list): Listing records, one dict per listing.
+        key (str): Key of the S3 object the records came from, used when reporting.
+
+    Returns:
+        pyarrow.Table: Table with LISTING_SCHEMA.
+    """
+    columns = []
+    for field in LISTING_SCHEMA:
+        values = [record.get(field.name) for record in records]
+        try:
+            column = pa.array(values, type=field.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            if pa.types.is_string(field.type):
+                column = pa.array([None if value is None else str(value) for value in values], type=field.type)
+            else:
+                numbers = pd.to_numeric(pd.Series(values, dtype="object"), errors="coerce")
+                column = pa.array(numbers, type=field.type, from_pandas=True)
+            rejected = column.null_count - sum(value is None for value in values)
+            if rejected:
+                print(f"{key}: {rejected} {field.name} values could not be parsed and were set to null")
+        columns.append(column)
+    return pa.Table.from_arrays(columns, schema=LISTING_SCHEMA)
+
+
+def get_listing_table_from_s3_object(client: boto3.client, bucket_name: str, obj: dict) -> Optional[pa.Table]:
+    """
+    Downloads a single listing object from S3 and parses it into an Arrow table
+    with LISTING_SCHEMA.
+
+    Args:
+        client (boto3.client): S3 client.
+        bucket_name (str): Name of the S3 bucket.
+        obj (dict): Metadata of the object to download, as listed by get_s3_objects.
+
+    Returns:
+        Optional[pyarrow.Table]: Table for the object, or None if it could not be parsed.
+    """
+    body = get_s3_object_bytes(client, bucket_name, obj["Key"], obj["Size"], obj["ETag"])
+    try:
+        return get_listing_table_from_records(json.loads(body), obj["Key"])
+    except Exception as e:
+        print(e)
+        return None
+
 
 def get_df_from_s3(client: boto3.client, bucket_name: str, extract_date: str) -> pd.DataFrame:
     """
@@ -23,24 +251,143 @@ def get_df_from_s3(client: boto3.client, bucket_name: str, extract_date: str) ->
     Returns:
         pandas.DataFrame: DataFrame containing the retrieved data.
     """
-    objects_metadata = client.list_objects(Bucket=bucket_name, Prefix=f"real_estate/listings/{extract_date}")
-    keys = [obj["Key"] for obj in objects_metadata["Contents"]]
-    objects = [client.get_object(Bucket=bucket_name, Key=key) for key in keys]
-    dfs = []
-    for obj in objects:
-        try:
-            dfs.append(
-                pd.read_json(
-                    StringIO(obj["Body"].read().decode("utf-8")),
-                    dtype={"zipCode": "object"},
-                )
-            )
-        except Exception as e:
-            print(e)
-    df = pd.concat(dfs)
+    objects = get_s3_objects(client, bucket_name, f"real_estate/listings/{extract_date}")
+    with ThreadPoolExecutor(max_workers=S3_MAX_WORKERS) as executor:
+        tables = executor.map(lambda obj: get_listing_table_from_s3_object(client, bucket_name, obj), objects)
+        tables = [table for table in tables if table is not None]
+    # Concatenating Arrow tables only stacks chunks. Once the per-object tables are
+    # released, self_destruct can free each column as it is converted to pandas.
+    combined = pa.concat_tables(tables)
+    del tables
+    df = combined.to_pandas(split_blocks=True, self_destruct=True)
     return df
 
 
+def get_df_from_snowflake(
+    conn: snowflake.connector.SnowflakeConnection, query: str, params: Optional[tuple] = None
+) -> pd.DataFrame:
+    """
+    Runs a query against Snowflake and returns the result as a DataFrame.
+
+    Args:
+        conn (snowflake.connector.SnowflakeConnection): Snowflake connection.
+        query (str): SQL query to execute, with ? placeholders for params.
+        params (Optional[tuple]): Values bound to the query placeholders.
+
+    Returns:
+        pandas.DataFrame: DataFrame containing the query result.
+    """
+    with conn.cursor() as cur:
+        cur.execute(query, params)
+        return cur.fetch_pandas_all()
+
+
+def convert_zip_codes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts the ZIP_CODE column to int32 so it can be used as a compact join key.
+    Rows whose zip code is missing or not a whole number (e.g. "" or "19801-1234")
+    are dropped, as they could never match in the location merge.
+
+    Args:
+        df (pd.DataFrame): DataFrame with a ZIP_CODE column.
+
+    Returns:
+        pd.DataFrame: DataFrame with valid zip codes only, as int32.
+    """
+    zip_codes = pd.to_numeric(df["ZIP_CODE"], errors="coerce")
+    valid = zip_codes.notna() & (zip_codes % 1 == 0)
+    return df[valid].assign(ZIP_CODE=zip_codes[valid].astype("int32"))
+
+
+@lru_cache(maxsize=1)
+def get_location_df(as_of: str) -> pd.DataFrame:
+    """
+    Retrieves the Delaware locations from dim_location, cached per day so warm
+    invocations skip the query. On a cache miss the query runs on the connection
+    main validated with get_snowflake_conn for this invocation.
+
+    Args:
+        as_of (str): ISO date the cached result is valid for.
+
+    Returns:
+        pandas.DataFrame: DataFrame with LOCATION_ID and an int32 ZIP_CODE column.
+    """
+    location_df = get_df_from_snowflake(
+        _SNOWFLAKE_CONN, "SELECT location_id, zip_code FROM dim_location WHERE state = 'DE'"
+    )
+    return convert_zip_codes(location_df)
+
+
+@lru_cache(maxsize=8)
+def get_dim_date_df(start_date: date, end_date: date) -> pd.DataFrame:
+    """
+    Retrieves the dim_date rows between two dates, cached per date range. On a cache
+    miss the query runs on the connection main validated with get_snowflake_conn
+    for this invocation.
+
+    Args:
+        start_date (date): First date to include.
+        end_date (date): Last date to include.
+
+    Returns:
+        pandas.DataFrame: DataFrame with DATE_ID and a datetime64 DATE column.
+    """
+    dim_date_df = get_df_from_snowflake(
+        _SNOWFLAKE_CONN,
+        "SELECT date_id, date FROM dim_date WHERE date BETWEEN ? AND ?",
+        (start_date, end_date),
+    )
+    dim_date_df["DATE"] = pd.to_datetime(dim_date_df["DATE"])
+    return dim_date_df
+
+
+def get_month_bounds(min_date: date, max_date: date) -> Tuple[date, date]:
+    """
+    Widens a date range to whole months so that nearby ranges share a dim_date cache entry.
+
+    Args:
+        min_date (date): Start of the range.
+        max_date (date): End of the range.
+
+    Returns:
+        Tuple[date, date]: First day of min_date's month and last day of max_date's month.
+    """
+    next_month = max_date.replace(day=28) + timedelta(days=4)
+    return min_date.replace(day=1), next_month - timedelta(days=next_month.day)
+
+
+def load_df_to_snowflake(conn: snowflake.connector.SnowflakeConnection, df: pd.DataFrame, table_name: str) -> None:
+    """
+    Loads a DataFrame into a Snowflake table by writing it to a single Parquet file,
+    PUTting it to the user stage and copying it into the table.
+
+    Args:
+        conn (snowflake.connector.SnowflakeConnection): Snowflake connection.
+        df (pd.DataFrame): DataFrame to load. Column names must match the table's.
+        table_name (str): Name of the target table.
+    """
+    stage_path = f"@~/etl_stage/{table_name.lower()}/{uuid.uuid4()}"
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file_path = os.path.join(tmp_dir, f"{table_name.lower()}.parquet")
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), file_path, compression="snappy")
+        with conn.cursor() as cur:
+            try:
+                cur.execute(
+                    f"PUT file://{file_path} {stage_path} AUTO_COMPRESS=FALSE PARALLEL={SNOWFLAKE_PUT_PARALLEL}"
+                )
+                cur.execute(
+                    f"COPY INTO {table_name} FROM {stage_path} "
+                    "FILE_FORMAT=(TYPE=PARQUET) MATCH_BY_COLUMN_NAME=CASE_INSENSITIVE PURGE=TRUE"
+                )
+            except Exception:
+                # PURGE only removes the file after a successful load
+                try:
+                    cur.execute(f"REMOVE {stage_path}")
+                except Exception as e:
+                    print(e)
+                raise
+
+
 def get_min_and_max_date_from_df(df: pd.DataFrame) -> Tuple[date, date]:
     """
     Retrieves the minimum and maximum dates from the specified DataFrame columns.
@@ -52,31 +399,31 @@ def get_min_and_max_date_from_df(df: pd.DataFrame) -> Tuple[date, date]:
         Tuple[date, date]: Minimum and maximum dates as datetime.date objects.
     """
     df = df[["LISTED_DATE", "REMOVED_DATE", "SNAPSHOT_DATE"]]
-    min_date = min(filter(lambda x: not pd.isna(x), df.min().values))
-    max_date = max(filter(lambda x: not pd.isna(x), df.max().values))
+    min_date = df.min().min().date()
+    max_date = df.max().max().date()
     return min_date, max_date
 
 
-def merge_and_rename_date_columns(listing_df: pd.DataFrame, dim_date_df: pd.DataFrame) -> pd.DataFrame:
+def add_date_id_columns(listing_df: pd.DataFrame, dim_date_df: pd.DataFrame) -> pd.DataFrame:
     """
-    Merges a listing DataFrame with a dimension date DataFrame and renames the merged date columns.
+    Looks up the dim_date ids of the listed, removed and snapshot dates of a listing DataFrame.
+    Rows whose listed or snapshot date is missing from dim_date are dropped.
 
     Args:
         listing_df (pd.DataFrame): The listing DataFrame.
         dim_date_df (pd.DataFrame): The dimension date DataFrame.
 
     Returns:
-        pd.DataFrame: The merged DataFrame with renamed date columns.
+        pd.DataFrame: The listing DataFrame with LISTED_DATE_ID, REMOVED_DATE_ID and SNAPSHOT_DATE_ID columns.
     """
-    df_with_listed_date_id = listing_df.merge(dim_date_df, left_on="LISTED_DATE", right_on="DATE")
-    df_with_listed_date_id = df_with_listed_date_id.rename(columns={"DATE_ID": "LISTED_DATE_ID"})
-    df_with_removed_date_id = df_with_listed_date_id.merge(
-        dim_date_df, how="left", left_on="REMOVED_DATE", right_on="DATE"
+    date_to_id = pd.Series(dim_date_df.DATE_ID.values, index=dim_date_df.DATE)
+    listing_df = listing_df.assign(
+        LISTED_DATE_ID=listing_df.LISTED_DATE.map(date_to_id),
+        REMOVED_DATE_ID=listing_df.REMOVED_DATE.map(date_to_id),
+        SNAPSHOT_DATE_ID=listing_df.SNAPSHOT_DATE.map(date_to_id),
     )
-    df_with_removed_date_id = df_with_removed_date_id.rename(columns={"DATE_ID": "REMOVED_DATE_ID"})
-    df_with_snapshot_id = df_with_removed_date_id.merge(dim_date_df, left_on="SNAPSHOT_DATE", right_on="DATE")
-    df_with_all_ids = df_with_snapshot_id.rename(columns={"DATE_ID": "SNAPSHOT_DATE_ID"})
-    return df_with_all_ids
+    listing_df = listing_df.dropna(subset=["LISTED_DATE_ID", "SNAPSHOT_DATE_ID"])
+    return listing_df.astype({"LISTED_DATE_ID": date_to_id.dtype, "SNAPSHOT_DATE_ID": date_to_id.dtype})
 
 
 def transform_listing_df(listing_df: pd.DataFrame) -> pd.DataFrame:
@@ -89,39 +436,17 @@ def transform_listing_df(listing_df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pandas.DataFrame: Transformed DataFrame.
     """
-    listing_df = listing_df.rename(
-        columns={
-            "zipCode": "ZIP_CODE",
-            "id": "LISTING_ID",
-            "price": "PRICE",
-            "bedrooms": "BEDROOMS",
-            "bathrooms": "BATHROOMS",
-            "squareFootage": "SQUARE_FOOTAGE",
-            "propertyType": "PROPERTY_TYPE",
-            "listedDate": "LISTED_DATE",
-            "removedDate": "REMOVED_DATE",
-            "yearBuilt": "YEAR_BUILT",
-            "lotSize": "LOT_SIZE",
-        }
-    )
-    keep_columns = [
-        "ZIP_CODE",
-        "PRICE",
-        "BATHROOMS",
-        "BEDROOMS",
-        "SQUARE_FOOTAGE",
-        "PROPERTY_TYPE",
-        "LISTED_DATE",
-        "REMOVED_DATE",
-        "LOT_SIZE",
-        "YEAR_BUILT",
-    ]
-    listing_df = listing_df[keep_columns]
-    listing_df = listing_df.dropna(subset=filter(lambda x: x != "REMOVED_DATE", listing_df.columns))
-    listing_df.YEAR_BUILT = listing_df.YEAR_BUILT.astype(int)
-    listing_df.PRICE = listing_df.PRICE.astype(float)
-    listing_df.LISTED_DATE = pd.to_datetime(listing_df.LISTED_DATE).dt.date
-    listing_df["SNAPSHOT_DATE"] = date.today()
+    listing_df = listing_df.rename(columns=LISTING_COLUMNS)
+    listing_df = listing_df[list(LISTING_COLUMNS.values())]
+    listing_df = listing_df.dropna(subset=LISTING_NONNULL_COLUMNS)
+    listing_df = listing_df.astype({"YEAR_BUILT": int, "PRICE": float})
+    listing_df = convert_zip_codes(listing_df)
+    # Date keys are kept as datetime64[ns] values at midnight so add_date_id_columns can look them up
+    # in dim_date with a vectorized map. Only the date prefix of the ISO timestamps is parsed, with a
+    # fixed format and repeated values cached.
+    for column in ["LISTED_DATE", "REMOVED_DATE"]:
+        listing_df[column] = pd.to_datetime(listing_df[column].str[:10], format="%Y-%m-%d", cache=True)
+    listing_df["SNAPSHOT_DATE"] = pd.Timestamp(date.today())
     return listing_df
 
 
@@ -137,27 +462,16 @@ def main(event: dict, context: dict) -> dict:
         dict: Response data containing the status code.
     """
     bucket_name = os.getenv("BUCKET_NAME")
-    client = boto3.client(
-        "s3",
-        endpoint_url="https://s3.amazonaws.com",
-        aws_access_key_id=os.getenv("ACCESS_KEY"),
-        aws_secret_access_key=os.getenv("SECRET_ACCESS_KEY"),
-    )
-    conn = snowflake.connector.connect(
-        user=os.getenv("SNOWFLAKE_USERNAME"),
-        password=os.getenv("SNOWFLAKE_PASSWORD"),
-        account=os.getenv("SNOWFLAKE_ACCOUNT"),
-        warehouse=os.getenv("WAREHOUSE"),
-        database=os.getenv("DATABASE"),
-        schema=os.getenv("SCHEMA"),
-    )
+    client = get_s3_client()
+    conn = get_snowflake_conn()
     extract_date = event["extractDate"]
 
-    # Extract listing data from S3
-    listing_df = get_df_from_s3(client, bucket_name, extract_date)
-
-    # Get reference data from Snowflake
-    location_df = pd.read_sql("SELECT location_id, zip_code FROM dim_location WHERE state = 'DE'", conn)
+    # Extract listing data from S3 while getting reference data from Snowflake
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        listing_future = executor.submit(get_df_from_s3, client, bucket_name, extract_date)
+        location_future = executor.submit(get_location_df, date.today().isoformat())
+        listing_df = listing_future.result()
+        location_df = location_future.result()
 
     # Transform
     listing_df = transform_listing_df(listing_df)
@@ -165,16 +479,16 @@ def main(event: dict, context: dict) -> dict:
     # Get min and max dates from transformed data
     min_date, max_date = get_min_and_max_date_from_df(listing_df)
 
-    dim_date_df = pd.read_sql(
-        f"SELECT date_id, date FROM dim_date WHERE date >= '{min_date}' AND date <= '{max_date}'",
-        conn,
-    )
+    dim_date_df = get_dim_date_df(*get_month_bounds(min_date, max_date))
+
+    # Drop columns not loaded to Snowflake before joining
+    listing_df = listing_df.drop(columns=["PROPERTY_TYPE"])
 
     # Add location_id
     listing_merged_df = listing_df.merge(location_df, on="ZIP_CODE", how="inner")
 
     # Add date ids
-    final_df = merge_and_rename_date_columns(listing_merged_df, dim_date_df)
+    final_df = add_date_id_columns(listing_merged_df, dim_date_df)
 
     # Filter
     keep_cols = [
@@ -192,7 +506,7 @@ def main(event: dict, context: dict) -> dict:
     final_df = final_df[keep_cols]
 
     # Load to Snowflake
-    write_pandas(conn, final_df, "FACT_LISTING")
+    load_df_to_snowflake(conn, final_df, "FACT_LISTING")
 
     return {"statusCode": 200}
 